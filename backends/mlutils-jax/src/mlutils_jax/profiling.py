@@ -1,10 +1,11 @@
-from contextlib import contextmanager, nullcontext
+from contextlib import contextmanager
 from pathlib import Path
+from typing import NamedTuple
 
 import jax
 
 
-class ProfilingConfig:
+class ProfilingConfig(NamedTuple):
     enable: bool
     trace_folder_path: Path
     frequency: int
@@ -12,13 +13,22 @@ class ProfilingConfig:
 
 @contextmanager
 def maybe_enable_profiling(config: ProfilingConfig, step: int = 0):
+    # unlike the torch backend, this wraps a single step: enter it once per
+    # training step so that every `frequency`-th step gets a full trace.
+    # a non-positive frequency disables full traces and keeps only annotations.
     enable = config.enable
+    frequency = config.frequency
 
-    if enable:
+    if enable and frequency > 0 and step % frequency == 0:
         trace_folder = Path(config.trace_folder_path)
         trace_folder.mkdir(parents=True, exist_ok=True)
-        yield jax.profiler.trace(log_dir=trace_folder)
+        with jax.profiler.trace(log_dir=trace_folder):
+            yield None
+
+    elif enable:
+        # unsampled steps only get a cheap annotation
+        with jax.profiler.StepTraceAnnotation("step", step_num=step):
+            yield None
 
     else:
-        jax_profiler = nullcontext()
         yield None
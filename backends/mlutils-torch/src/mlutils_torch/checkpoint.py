@@ -1,7 +1,6 @@
-import re
+import os
 import time
 from concurrent.futures import Future
-from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from typing import Any, NamedTuple, override
@@ -10,6 +9,7 @@ import torch
 import torch.distributed as dist
 import torch.distributed.checkpoint as dcp
 import torch.nn as nn
+from torch.distributed.checkpoint import FileSystemWriter
 from torch.distributed.checkpoint.state_dict import (
     StateDictOptions,
     get_model_state_dict,
@@ -32,11 +32,11 @@ class ModelContainer(Stateful):
 
     @property
     def _state_dict(self) -> dict[str, Any]:
-        return {
-            k: v
-            for sd in map(get_model_state_dict, self.model_parts)
-            for k, v in sd.items()
-        }
+        state_dict = {}
+        for model_part in self.model_parts:
+            state_dict.update(get_model_state_dict(model_part))
+
+        return state_dict
 
     @override
     def state_dict(self) -> dict[str, Any]:
@@ -58,16 +58,15 @@ class OptimizerContainer(Stateful):
         self.optimizers: list[Optimizer] = optimizers
 
     @property
-    def _state_dict(self):
-        f = partial(
-            get_optimizer_state_dict,
-            options=StateDictOptions(flatten_optimizer_state_dict=True),
-        )
-        return {
-            k: v
-            for sd in map(f, self.model_parts, self.optimizers)
-            for k, v in sd.items()
-        }
+    def _state_dict(self) -> dict[str, Any]:
+        options = StateDictOptions(flatten_optimizer_state_dict=True)
+        state_dict = {}
+        for model_part, optimizer in zip(self.model_parts, self.optimizers):
+            state_dict.update(
+                get_optimizer_state_dict(model_part, optimizer, options=options)
+            )
+
+        return state_dict
 
     @override
     def state_dict(self) -> dict[str, Any]:
@@ -97,13 +96,14 @@ class SchedulerContainer(Stateful):
     @override
     def load_state_dict(self, state_dict: dict[str, Any]) -> None:
         for scheduler in self.schedulers:
-            scheduler.load_state_dict(deepcopy(state_dict))
+            scheduler.load_state_dict(state_dict.copy())
 
 
 class CheckpointConfig(NamedTuple):
     folder_path: Path
     interval: int
     model_only: bool
+    thread_count: int = 1
 
 
 class CheckpointManager:
@@ -128,6 +128,13 @@ class CheckpointManager:
                 "scheduler": scheduler,
             }
 
+        # persistent writer so the pinned staging buffers are reused across saves
+        self.storage_writer = FileSystemWriter(
+            self.folder_path,
+            thread_count=config.thread_count,
+            cache_staged_state_dict=True,
+        )
+
         self.save_future = None
         self.process_group = dist.new_group(backend="gloo")
         return
@@ -139,9 +146,13 @@ class CheckpointManager:
         checkpoint_id: Path,
         enable_garbage_collection: bool = False,
     ) -> Future[None]:
+        # the caching stager copies every tensor (CPU-resident ones included) into
+        # its pinned buffers before async_save returns, so the containers can keep
+        # handing out live references without racing the background write
         future = dcp.async_save(
             state_dict,
             checkpoint_id=checkpoint_id,
+            storage_writer=self.storage_writer,
             process_group=self.process_group,
             async_checkpointer_type=AsyncCheckpointerType.PROCESS,
         )
@@ -155,15 +166,31 @@ class CheckpointManager:
         begin = time.monotonic()
         checkpoint_id = self._create_checkpoint_id(step)
         self._async_wait()
+        GarbageCollector.collect("GC collection invoked by checkpointer.", generation=0)
 
-        GarbageCollector.collect("GC collection invoked by checkpointer.")
         self.save_future = self.dcp_save(self.states, checkpoint_id=checkpoint_id)
-        GarbageCollector.collect("GC collection invoked by checkpointer.")
+
+        if last_step:
+            # nothing else will be staged, so release the pinned staging buffers
+            self._async_wait()
+            self.storage_writer.state_dict_cache = None
 
         logger.info(
             f"Finished saving checkpoint in {time.monotonic() - begin:.2f} seconds."
         )
 
+    def finalize(self) -> None:
+        # call after the next optimizer step so the background write is not
+        # waited on while that step's collectives are still in flight
+        if self.save_future is None:
+            return
+
+        begin = time.monotonic()
+        self._async_wait()
+        logger.info(
+            f"Waited {time.monotonic() - begin:.2f} seconds for checkpoint write."
+        )
+
     @torch.no_grad()
     def load(self, checkpoint_id: Path) -> bool:
         if not checkpoint_id.exists():
@@ -185,19 +212,26 @@ class CheckpointManager:
             self.save_future = None
 
     def _create_checkpoint_id(self, step: int) -> Path:
-        return self.folder / f"step-{step}"
+        return self.folder_path / f"step-{step}"
 
     def _find_load_step(self) -> int:
-        pattern = r"step-(\d+)"
-
-        if not self.folder.exists() or not self.folder.is_dir():
+        if not self.folder_path.exists() or not self.folder_path.is_dir():
             return -1
 
         max_step = -1
-        for fname in self.folder.iterdir():
-            match = re.search(pattern, str(fname))
-            if match is not None:
-                max_step = max(max_step, int(match.group(1)))
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith("step-"):
+                    continue
+
+                # ASCII only: isdigit() is also true for e.g. "²", which int() rejects
+                tail = name[5:]
+                if not (tail.isascii() and tail.isdigit()):
+                    continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    max_step = max(max_step, int(tail))
 
         return max_step
 
@@ -24,7 +24,7 @@ class TensorboardLogger:
     ) -> None:
         self.tag = tag
         self.writer = (
-            SummaryWriter(config.dir_path, max_queue=1000)
+            SummaryWriter(config.dir_path, max_queue=10000)
             if config.enable_tensorboard
             else None
         )
@@ -88,16 +88,28 @@ class TorchMonitor:
         TorchMonitor.device_module.reset_peak_memory_stats()
         TorchMonitor.device_module.empty_cache()
 
+        # resolved once since get_stats is typically called every step
+        self._memory_stats_nested = (
+            TorchMonitor.device_module.memory_stats_as_nested_dict
+        )
+        self._stats_device = self.device.index
+        self._gib_inv = 1.0 / (1024**3)
+        self._pct_inv = 100.0 / self.device_capacity
+
     def get_stats(self) -> DeviceStats:
-        device_info = TorchMonitor.device_module.memory_stats(self.device)
+        # the nested dict is what the allocator returns; memory_stats would
+        # additionally flatten every entry in Python just for four lookups
+        device_info = self._memory_stats_nested(self._stats_device)
 
-        max_active = device_info.get("active_bytes.all.peak", -1)
-        max_active_gib = max_active / (1024**3)
-        max_active_pct = 100 * max_active / self.device_capacity
+        max_active = device_info.get("active_bytes", {}).get("all", {}).get("peak", -1)
+        max_active_gib = max_active * self._gib_inv
+        max_active_pct = max_active * self._pct_inv
 
-        max_reserv = device_info.get("reserved_bytes.all.peak", -1)
-        max_reserv_gib = max_reserv / (1024**3)
-        max_reserv_pct = 100 * max_reserv / self.device_capacity
+        max_reserv = (
+            device_info.get("reserved_bytes", {}).get("all", {}).get("peak", -1)
+        )
+        max_reserv_gib = max_reserv * self._gib_inv
+        max_reserv_pct = max_reserv * self._pct_inv
 
         num_alloc_retries = device_info.get("num_alloc_retries", -1)
         num_ooms = device_info.get("num_ooms", -1)
@@ -32,7 +32,10 @@ def maybe_enable_profiling(config: ProfilingConfig, step: int = 0):
             logger.info(f"Dumping profiler traces at step {prof.step_num}")
             begin = time.monotonic()
 
-            prof.export_chrome_trace(curr_trace_folder / f"rank{rank}_trace.json")
+            # the .gz suffix makes torch gzip the trace while exporting
+            prof.export_chrome_trace(
+                str(curr_trace_folder / f"rank{rank}_trace.json.gz")
+            )
             logger.info(
                 f"Finished dumping profiler traces in {time.monotonic() - begin} seconds."
             )
@@ -48,7 +51,10 @@ def maybe_enable_profiling(config: ProfilingConfig, step: int = 0):
             ],
             schedule=torch.profiler.schedule(wait=wait, warmup=warmup, active=active),
             on_trace_ready=trace_handler,
-            record_shapes=True,
+            record_shapes=False,
+            with_stack=False,
+            with_flops=False,
+            with_modules=False,
         ) as torch_profiler:
             torch_profiler.step_num = step
             yield torch_profiler
@@ -1,10 +1,37 @@
 import argparse
 import ast
+import os
 import tomllib
 from typing import Any
 
+_CONSTANTS = {"True": True, "False": False, "None": None}
+
 
 def parse_cmdline_string(s: str) -> Any:
+    if s in _CONSTANTS:
+        return _CONSTANTS[s]
+
+    # identifiers never evaluate to a literal; numbers rarely need the parser
+    if s.isidentifier():
+        return s
+
+    # ASCII only: int() would also accept digits from other scripts, and a
+    # leading zero ("007", "0_1") is a string here but an int to int()
+    digits = s.removeprefix("-")
+    if (
+        s.isascii()
+        and digits[:1].isdigit()
+        and not (len(digits) > 1 and digits[0] == "0")
+    ):
+        try:
+            return int(s)
+        except ValueError:
+            pass
+        try:
+            return float(s)
+        except ValueError:
+            pass
+
     try:
         return ast.literal_eval(s)
     except (ValueError, SyntaxError):
@@ -16,6 +43,11 @@ def load_config(parser: argparse.ArgumentParser) -> dict[str, Any]:
 
     if hasattr(args, "config_file"):
         with open(args.config_file, mode="rb") as f:
+            # best-effort hint; pipes and FIFOs (e.g. /dev/stdin) reject it
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass
             config = tomllib.load(f)
     else:
         config = {}
@@ -26,25 +58,14 @@ def load_config(parser: argparse.ArgumentParser) -> dict[str, Any]:
     args = args + uargs
 
     for keys, value in args:
-        if len(keys) == 1:
-            config[keys[0]] = value
-        elif len(keys) == 2:
-            if keys[0] in config:
-                assert isinstance(config[keys[0]], dict)
-                config[keys[0]][keys[1]] = value
-            else:
-                config[keys[0]] = {keys[1]: value}
-        elif len(keys) == 3:
-            if keys[0] in config:
-                assert isinstance(config[keys[0]], dict)
-                if keys[1] in config[keys[0]]:
-                    assert isinstance(config[keys[0]][keys[1]], dict)
-                    config[keys[0]][keys[1]][keys[2]] = value
-                else:
-                    config[keys[0]][keys[1]] = {keys[2]: value}
-            else:
-                config[keys[0]] = {keys[1]: {keys[2]: value}}
-        else:
-            raise ValueError("Maximum key depth is 3.")
+        _insert(config, keys, value)
 
     return config
+
+
+def _insert(config: dict[str, Any], keys: list[str], value: Any) -> None:
+    d = config
+    for key in keys[:-1]:
+        d = d.setdefault(key, {})
+        assert isinstance(d, dict)
+    d[keys[-1]] = value
@@ -6,15 +6,22 @@ from mlutils.logging import logger
 
 class GarbageCollector:
     def __init__(self, interval: int = 1000):
-        self.interval: float = interval
+        self.interval: int = interval
         gc.disable()
 
-    def run(self, step: int) -> None:
-        if step % self.interval == 0:
-            self.collect("Periodic garbage collection.")
+    def run(self, step: int, generation: int = 1) -> None:
+        # a non-positive interval disables periodic collection
+        if self.interval <= 0 or step % self.interval:
+            return
+
+        self.collect("Periodic garbage collection.", generation)
 
     @staticmethod
-    def collect(reason: str, generation: int = 1):
+    def collect(reason: str, generation: int = 0):
         begin = time.monotonic()
         _ = gc.collect(generation)
-        logger.info(f"GC: {reason} {time.monotonic() - begin:.2f} seconds.")
+        elapsed = time.monotonic() - begin
+
+        # skip logging sweeps too short to show up in the formatted time
+        if elapsed > 0.01:
+            logger.info(f"GC: {reason} {elapsed:.2f} seconds.")